@@ -45,7 +45,7 @@ class AgentLoop:
         self.max_steps = max_steps
 
         self.context = ContextBuilder(workspace)
-        self.sessions = SessionManager(workspace)
+        self.sessions = SessionManager()
         self.tools = ToolRegistry()
 
         self.subagents = SubagentManager(
@@ -145,7 +145,7 @@ class AgentLoop:
 
         session.add_message("user", msg.content)
         session.add_message("assistant", final_answer)
-        self.sessions.save(session)
+        self.sessions.append(session)
 
         return OutboundMessage(
             channel=msg.channel,
@@ -308,6 +308,7 @@ def gateway(
     from clawai.scheduler.service import CronService
     from clawai.scheduler.types import CronJob
     from clawai.heartbeat.service import HeartbeatService
+    from clawai.tools import web as web_tools
 
     if verbose:
         import logging
@@ -319,7 +320,7 @@ def gateway(
     bus = MessageBus()
     provider = _make_provider(config)
 
-    session_manager = SessionManager(config.workspace_path)
+    session_manager = SessionManager()
 
     cron_store_path = get_data_dir() / "cron" / "jobs.json"
     cron = CronService(cron_store_path)
@@ -362,6 +363,7 @@ def gateway(
             await cron.stop()
             await agent.stop()
             await channels.stop_all()
+            await web_tools.aclose()
 
     asyncio.run(run())
 
@@ -4,7 +4,9 @@ Base LLM provider interface for ClawAI Agent.
 
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -76,17 +78,32 @@ class LLMResponse:
 
 
 # ---------------------------------------------------------------------------
-# Streaming (optional but future-proof)
+# Streaming
 # ---------------------------------------------------------------------------
 
 @dataclass(slots=True)
-class LLMDelta:
+class ToolCallDelta:
+    """
+    Fragment of a tool call streamed by the LLM.
+
+    Fragments sharing an ``index`` belong to the same call; ``arguments``
+    is a raw JSON text fragment to be concatenated.
+    """
+    index: int
+    id: str | None = None
+    name: str | None = None
+    arguments: str | None = None
+
+
+@dataclass(slots=True)
+class LLMStreamChunk:
     """
     Partial streaming chunk from LLM.
     """
-    content: str | None = None
-    tool_call: ToolCall | None = None
-    done: bool = False
+    delta: str | None = None
+    tool_call_deltas: list[ToolCallDelta] = field(default_factory=list)
+    finish_reason: str | None = None
+    usage: TokenUsage | None = None
 
 
 # ---------------------------------------------------------------------------
@@ -99,7 +116,7 @@ class LLMProvider(ABC):
 
     Provider responsibilities:
     - Translate ClawAI messages → provider API
-    - Normalize provider response → LLMResponse / LLMDelta
+    - Normalize provider response → LLMResponse / LLMStreamChunk
     """
 
     def __init__(
@@ -137,7 +154,7 @@ class LLMProvider(ABC):
         model: str | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
-    ):
+    ) -> AsyncIterator[LLMStreamChunk]:
         """
         Optional streaming interface.
 
@@ -151,7 +168,20 @@ class LLMProvider(ABC):
             max_tokens=max_tokens,
             temperature=temperature,
         )
-        yield LLMDelta(content=response.content, done=True)
+        yield LLMStreamChunk(
+            delta=response.content,
+            tool_call_deltas=[
+                ToolCallDelta(
+                    index=i,
+                    id=tc.id,
+                    name=tc.name,
+                    arguments=json.dumps(tc.arguments),
+                )
+                for i, tc in enumerate(response.tool_calls)
+            ],
+            finish_reason=response.finish_reason,
+            usage=response.usage,
+        )
 
     # ---------------------------------------------------------------------
 
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 import os
 import json
+from collections.abc import AsyncIterator
 from typing import Any
 
 import litellm
@@ -14,11 +15,20 @@ from litellm import acompletion
 from clawai.llm.base import (
     LLMProvider,
     LLMResponse,
+    LLMStreamChunk,
     ToolCall,
+    ToolCallDelta,
     TokenUsage,
 )
 
 
+# Process-wide LiteLLM settings are applied once at import time; everything
+# provider-specific (api_base, keys) stays on the instance / per-call kwargs.
+if not getattr(litellm, "_clawai_configured", False):
+    litellm.suppress_debug_info = True
+    litellm._clawai_configured = True
+
+
 class LiteLLMProvider(LLMProvider):
     """
     LLM provider backed by LiteLLM.
@@ -40,7 +50,21 @@ class LiteLLMProvider(LLMProvider):
 
         self._detect_provider_mode()
         self._configure_env()
-        self._configure_litellm()
+
+        # Per-call kwargs that never change for this instance.
+        self._base_kwargs: dict[str, Any] = {
+            "timeout": self.timeout,
+            "stream": True,
+            # Streamed responses only report token usage when asked to.
+            "stream_options": {"include_usage": True},
+        }
+        if self.api_base:
+            self._base_kwargs["api_base"] = self.api_base
+        # Per call, so each instance uses its own key whatever the env holds.
+        if self.api_key:
+            self._base_kwargs["api_key"] = self.api_key
+
+        self._acompletion = acompletion
 
     # ---------------------------------------------------------------------
     # Provider detection
@@ -61,31 +85,32 @@ class LiteLLMProvider(LLMProvider):
         if not self.api_key:
             return
 
+        # Only a default for code reading the env; calls pass api_key.
+        env_key = self._resolve_env_key()
+        if env_key:
+            os.environ.setdefault(env_key, self.api_key)
+
+    def _resolve_env_key(self) -> str | None:
         if self.is_openrouter:
-            os.environ.setdefault("OPENROUTER_API_KEY", self.api_key)
-            return
+            return "OPENROUTER_API_KEY"
 
         model = self.default_model.lower()
 
         if self.is_vllm:
-            os.environ.setdefault("OPENAI_API_KEY", self.api_key)
-        elif "anthropic" in model:
-            os.environ.setdefault("ANTHROPIC_API_KEY", self.api_key)
-        elif "openai" in model or "gpt" in model:
-            os.environ.setdefault("OPENAI_API_KEY", self.api_key)
-        elif "gemini" in model:
-            os.environ.setdefault("GEMINI_API_KEY", self.api_key)
-        elif "deepseek" in model:
-            os.environ.setdefault("DEEPSEEK_API_KEY", self.api_key)
-        elif any(k in model for k in ("glm", "zhipu", "zai")):
-            os.environ.setdefault("ZHIPUAI_API_KEY", self.api_key)
-        elif "groq" in model:
-            os.environ.setdefault("GROQ_API_KEY", self.api_key)
-
-    def _configure_litellm(self) -> None:
-        if self.api_base:
-            litellm.api_base = self.api_base
-        litellm.suppress_debug_info = True
+            return "OPENAI_API_KEY"
+        if "anthropic" in model:
+            return "ANTHROPIC_API_KEY"
+        if "openai" in model or "gpt" in model:
+            return "OPENAI_API_KEY"
+        if "gemini" in model:
+            return "GEMINI_API_KEY"
+        if "deepseek" in model:
+            return "DEEPSEEK_API_KEY"
+        if any(k in model for k in ("glm", "zhipu", "zai")):
+            return "ZHIPUAI_API_KEY"
+        if "groq" in model:
+            return "GROQ_API_KEY"
+        return None
 
     # ---------------------------------------------------------------------
     # Chat
@@ -99,26 +124,41 @@ class LiteLLMProvider(LLMProvider):
         max_tokens: int = 4096,
         temperature: float = 0.7,
     ) -> LLMResponse:
-        model = self._normalize_model_name(model or self.default_model)
-
-        kwargs: dict[str, Any] = {
-            "model": model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-            "timeout": self.timeout,
-        }
-
-        if tools:
-            kwargs["tools"] = tools
-            kwargs["tool_choice"] = "auto"
-
-        if self.api_base:
-            kwargs["api_base"] = self.api_base
+        """
+        Collect a streamed completion into a single LLMResponse.
+        """
+        content_parts: list[str] = []
+        tool_parts: dict[int, dict[str, Any]] = {}
+        finish_reason = "stop"
+        usage: TokenUsage | None = None
+        raw_chunks: list[Any] = []
 
         try:
-            raw = await acompletion(**kwargs)
-            return self._parse_response(raw)
+            async for raw_chunk in self._stream_raw(
+                messages, tools, model, max_tokens, temperature
+            ):
+                raw_chunks.append(raw_chunk)
+                chunk = self._parse_chunk(raw_chunk)
+
+                if chunk.delta:
+                    content_parts.append(chunk.delta)
+
+                for tcd in chunk.tool_call_deltas:
+                    part = tool_parts.setdefault(
+                        tcd.index, {"id": "", "name": "", "arguments": []}
+                    )
+                    if tcd.id:
+                        part["id"] = tcd.id
+                    if tcd.name:
+                        # Some providers repeat the full name in every delta.
+                        part["name"] = tcd.name
+                    if tcd.arguments:
+                        part["arguments"].append(tcd.arguments)
+
+                if chunk.finish_reason:
+                    finish_reason = chunk.finish_reason
+                if chunk.usage:
+                    usage = chunk.usage
 
         except Exception as e:
             return LLMResponse(
@@ -127,48 +167,122 @@ class LiteLLMProvider(LLMProvider):
                 raw=str(e),
             )
 
+        tool_calls = [
+            ToolCall(
+                id=part["id"],
+                name=part["name"],
+                arguments=self._parse_arguments("".join(part["arguments"])),
+            )
+            for _, part in sorted(tool_parts.items())
+        ]
+
+        return LLMResponse(
+            content="".join(content_parts) if content_parts else None,
+            tool_calls=tool_calls,
+            finish_reason=finish_reason,
+            usage=usage,
+            raw=self._build_raw(raw_chunks, messages),
+        )
+
+    async def chat_stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None = None,
+        model: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[LLMStreamChunk]:
+        """
+        Stream a chat completion as it is generated.
+
+        Provider errors propagate to the caller.
+        """
+        async for chunk in self._stream_raw(
+            messages, tools, model, max_tokens, temperature
+        ):
+            yield self._parse_chunk(chunk)
+
+    async def _stream_raw(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[dict[str, Any]] | None,
+        model: str | None,
+        max_tokens: int,
+        temperature: float,
+    ) -> AsyncIterator[Any]:
+        """Yield provider-native stream chunks."""
+        model = self._normalize_model_name(model or self.default_model)
+
+        kwargs = self._base_kwargs.copy()
+        kwargs.update(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+        )
+
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = "auto"
+
+        async for chunk in await self._acompletion(**kwargs):
+            yield chunk
+
     # ---------------------------------------------------------------------
     # Parsing
     # ---------------------------------------------------------------------
 
-    def _parse_response(self, response: Any) -> LLMResponse:
-        choice = response.choices[0]
-        message = choice.message
-
-        tool_calls: list[ToolCall] = []
-
-        for tc in getattr(message, "tool_calls", []) or []:
-            args = tc.function.arguments
-            if isinstance(args, str):
-                try:
-                    args = json.loads(args)
-                except json.JSONDecodeError:
-                    args = {"raw": args}
-
-            tool_calls.append(
-                ToolCall(
-                    id=tc.id,
-                    name=tc.function.name,
-                    arguments=args,
-                )
-            )
-
+    def _parse_chunk(self, chunk: Any) -> LLMStreamChunk:
         usage = None
-        if getattr(response, "usage", None):
+        if getattr(chunk, "usage", None):
             usage = TokenUsage(
-                prompt_tokens=response.usage.prompt_tokens,
-                completion_tokens=response.usage.completion_tokens,
-                total_tokens=response.usage.total_tokens,
+                prompt_tokens=chunk.usage.prompt_tokens,
+                completion_tokens=chunk.usage.completion_tokens,
+                total_tokens=chunk.usage.total_tokens,
             )
 
-        return LLMResponse(
-            content=message.content,
-            tool_calls=tool_calls,
-            finish_reason=choice.finish_reason or "stop",
+        if not chunk.choices:
+            return LLMStreamChunk(usage=usage)
+
+        choice = chunk.choices[0]
+        delta = choice.delta
+
+        tool_call_deltas = [
+            ToolCallDelta(
+                index=i if getattr(tc, "index", None) is None else tc.index,
+                id=tc.id,
+                name=tc.function.name if tc.function else None,
+                arguments=tc.function.arguments if tc.function else None,
+            )
+            for i, tc in enumerate(getattr(delta, "tool_calls", None) or [])
+        ]
+
+        return LLMStreamChunk(
+            delta=getattr(delta, "content", None),
+            tool_call_deltas=tool_call_deltas,
+            finish_reason=choice.finish_reason,
             usage=usage,
-            raw=response,
         )
 
+    @staticmethod
+    def _build_raw(chunks: list[Any], messages: list[dict[str, Any]]) -> Any | None:
+        """Reassemble the provider-native response from its stream chunks."""
+        if not chunks:
+            return None
+        try:
+            return litellm.stream_chunk_builder(chunks, messages=messages)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _parse_arguments(args: str) -> dict[str, Any]:
+        if not args:
+            return {}
+        try:
+            return json.loads(args)
+        except json.JSONDecodeError:
+            return {"raw": args}
+
     # ---------------------------------------------------------------------
     # Model normalization
     # ---------------------------------------------------------------------
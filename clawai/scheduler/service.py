@@ -35,7 +35,7 @@ from clawai.scheduler.types import (
 # ============================================================
 
 DEFAULT_TICK_INTERVAL_S = 1.0
-DEFAULT_STORE_FLUSH_INTERVAL_S = 5.0
+DEFAULT_STORE_FLUSH_DEBOUNCE_S = 0.5
 
 
 # ============================================================
@@ -110,8 +110,11 @@ class CronService:
 
         self._scheduler_task: Optional[asyncio.Task] = None
         self._flush_task: Optional[asyncio.Task] = None
+        # Store write currently running in a worker thread, if any.
+        self._pending_write: Optional[asyncio.Future] = None
 
         self._wakeup_event = asyncio.Event()
+        self._dirty_event = asyncio.Event()
 
     # ============================================================
     # Lifecycle
@@ -148,6 +151,14 @@ class CronService:
                 except asyncio.CancelledError:
                     pass
 
+        # Cancelling the flush task does not stop a write already handed to
+        # a worker thread; let it land before the final save.
+        if self._pending_write:
+            try:
+                await self._pending_write
+            except Exception:
+                logger.exception("Cron store flush failed")
+
         self._save_store()
         logger.info("Cron scheduler stopped")
 
@@ -180,8 +191,15 @@ class CronService:
     async def _flush_loop(self) -> None:
         try:
             while self._running:
-                await asyncio.sleep(DEFAULT_STORE_FLUSH_INTERVAL_S)
-                self._save_store()
+                await self._dirty_event.wait()
+                self._dirty_event.clear()
+                # Debounce: coalesce a burst of mutations into one write.
+                await asyncio.sleep(DEFAULT_STORE_FLUSH_DEBOUNCE_S)
+                try:
+                    await self._save_store_async()
+                except Exception:
+                    # Keep flushing: the next mutation retries the write.
+                    logger.exception("Cron store flush failed")
         except asyncio.CancelledError:
             pass
 
@@ -221,6 +239,8 @@ class CronService:
             else:
                 job.enabled = False
 
+        self._mark_dirty()
+
     # ============================================================
     # Scheduling Logic
     # ============================================================
@@ -270,6 +290,25 @@ class CronService:
         self.store_path.parent.mkdir(parents=True, exist_ok=True)
         self._store.dump(self.store_path)
 
+    async def _save_store_async(self) -> None:
+        if not self._store:
+            return
+        # Snapshot on the loop thread; only the file write is offloaded.
+        data = self._store.dumps()
+        self.store_path.parent.mkdir(parents=True, exist_ok=True)
+        self._pending_write = asyncio.ensure_future(
+            asyncio.to_thread(CronStore.write, self.store_path, data)
+        )
+        # Shielded so stop() can still await the write after cancelling us.
+        await asyncio.shield(self._pending_write)
+
+    def _mark_dirty(self) -> None:
+        """Schedule a store write; saves immediately if the service is not running."""
+        if self._running:
+            self._dirty_event.set()
+        else:
+            self._save_store()
+
     # ============================================================
     # Public API
     # ============================================================
@@ -304,7 +343,7 @@ class CronService:
         )
 
         self._store.jobs.append(job)
-        self._save_store()
+        self._mark_dirty()
         self._wakeup_event.set()
 
         logger.info("Cron added | {} ({})", name, job.id)
@@ -316,7 +355,7 @@ class CronService:
         removed = len(self._store.jobs) < before
 
         if removed:
-            self._save_store()
+            self._mark_dirty()
             self._wakeup_event.set()
             logger.info("Cron removed | {}", job_id)
 
@@ -326,7 +365,6 @@ class CronService:
         for job in self._store.jobs:
             if job.id == job_id:
                 await self._execute_job(job)
-                self._save_store()
                 self._wakeup_event.set()
                 return True
         return False
@@ -244,8 +244,31 @@ class CronStore:
         return cls.from_dict(data)
 
     def dump(self, path):
+        self.write(path, self.dumps())
+
+    def dumps(self) -> str:
         import json
-        path.write_text(json.dumps(self.to_dict(), indent=2))
+        return json.dumps(self.to_dict(), indent=2)
+
+    @staticmethod
+    def write(path, data: str) -> None:
+        """Write serialized store data atomically (temp file + rename)."""
+        import os
+        import tempfile
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+            raise
 
     def to_dict(self) -> dict:
         from dataclasses import asdict
@@ -10,7 +10,13 @@ Design principles (ClawAI style):
 
 from __future__ import annotations
 
-import json
+import hashlib
+import mmap
+import os
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterator, MutableSequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -19,10 +25,263 @@ from loguru import logger
 
 from clawai.utils.helpers import (
     RUNTIME_PATHS,
+    fsync_dir,
     now_iso,
     safe_filename,
+    write_all,
 )
 
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+    _Fragment = getattr(orjson, "Fragment", None)  # orjson >= 3.9
+except ImportError:  # pragma: no cover - stdlib fallback
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+    _loads = json.loads
+    _Fragment = None
+
+_NEWLINE = _Fragment(b"\n") if _Fragment else None
+
+try:
+    import zstandard as zstd
+except ImportError:  # optional: sessions stay plain JSONL
+    zstd = None
+
+
+DEFAULT_CACHE_SIZE = 256
+
+SESSION_SUFFIX = ".jsonl"
+COMPRESSED_SUFFIX = ".jsonl.zst"
+ZSTD_LEVEL = 1
+
+# Metadata is the first line of a session file; read at most this much.
+META_READ_SIZE = 65536
+
+# Below this many files the fallback scan stays serial.
+SCAN_PARALLEL_MIN = 32
+
+# append() falls back to a full save() (compaction) this often.
+COMPACT_EVERY_APPENDS = 32
+# ...or, for zstd files, once per-append frames outgrow the single-frame
+# base written by the last save() by this factor.
+COMPACT_FRAME_RATIO = 1
+
+# Sidecar metadata index so list() parses one file instead of N.
+INDEX_FILENAME = "_index.jsonl"
+INDEX_COMPACT_SLACK = 64
+INDEX_COMPACT_EVERY = 4096
+
+
+def _dumps_lines(items: list[Any]) -> bytes:
+    """
+    Encode items as newline-terminated JSONL.
+
+    bytes items are already-encoded lines and are copied verbatim.
+    """
+    if not items:
+        return b""
+    if _NEWLINE is None:
+        return b"\n".join(i if isinstance(i, bytes) else _dumps(i) for i in items) + b"\n"
+
+    # One dumps() call for the whole batch: orjson never emits a raw
+    # newline, so ",\n," can only be the separator fragment.
+    seq: list[Any] = [_NEWLINE] * (2 * len(items) - 1)
+    seq[0::2] = [_Fragment(i) if isinstance(i, bytes) else i for i in items]
+    return _dumps(seq)[1:-1].replace(b",\n,", b"\n") + b"\n"
+
+
+def _decompress(data: bytes) -> bytes:
+    # Each append() adds a frame, so read across all of them.
+    with zstd.ZstdDecompressor().stream_reader(data, read_across_frames=True) as r:
+        return r.read()
+
+
+def _read_plain(path: Path) -> bytes:
+    """Read a session file as uncompressed JSONL bytes."""
+    with open(path, "rb") as f:
+        data = f.read()
+    return _decompress(data) if path.name.endswith(COMPRESSED_SUFFIX) else data
+
+
+def _read_prefix(path: str) -> bytes:
+    if not path.endswith(COMPRESSED_SUFFIX):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            return os.read(fd, META_READ_SIZE)
+        finally:
+            os.close(fd)
+
+    parts: list[bytes] = []
+    with open(path, "rb") as f, zstd.ZstdDecompressor().stream_reader(f) as r:
+        size = 0
+        while size < META_READ_SIZE:
+            chunk = r.read(META_READ_SIZE - size)
+            if not chunk:
+                break
+            parts.append(chunk)
+            size += len(chunk)
+            if b"\n" in chunk:
+                break
+    return b"".join(parts)
+
+
+def _read_meta(path: str) -> dict[str, Any] | None:
+    """Parse the metadata line of a session file into a list() entry."""
+    try:
+        buf = _read_prefix(path)
+        nl = buf.find(b"\n")
+        meta = _loads(buf[:nl] if nl >= 0 else buf)
+    except Exception:
+        return None
+
+    if not isinstance(meta, dict) or meta.get("_type") != "metadata":
+        return None
+
+    key = meta.get("key")
+    if not key:
+        # Files written before the key was stored fall back to the filename;
+        # strip the exact suffix, since keys may themselves contain dots.
+        name = os.path.basename(path)
+        suffix = COMPRESSED_SUFFIX if name.endswith(COMPRESSED_SUFFIX) else SESSION_SUFFIX
+        key = name.removesuffix(suffix).replace("_", ":")
+
+    return {
+        "key": key,
+        "created_at": meta.get("created_at"),
+        "updated_at": meta.get("updated_at"),
+        "path": path,
+    }
+
+
+def _map_file(path: Path) -> bytes | mmap.mmap:
+    """Map a plain session file read-only (bytes where mmap does not fit)."""
+    if path.name.endswith(COMPRESSED_SUFFIX):
+        return _read_plain(path)
+    with open(path, "rb") as f:
+        # Windows cannot replace a mapped file, which save() relies on.
+        if os.name == "nt" or os.fstat(f.fileno()).st_size == 0:
+            return f.read()
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# ===========================
+# Lazy Message Store
+# ===========================
+
+class LazyMessages(MutableSequence):
+    """
+    List-like message sequence backed by raw JSONL lines.
+
+    Persisted messages are decoded on first access only; messages added
+    afterwards are kept as plain dicts. Edits other than append/clear
+    materialize the whole sequence into a list. Spans must hold valid
+    JSON (_load validates them).
+    """
+
+    __slots__ = ("_buf", "_spans", "_decoded", "_tail", "_items")
+
+    def __init__(self, buf: bytes | mmap.mmap, spans: array):
+        self._buf = buf
+        self._spans = spans              # flat (start, end) pairs, one per line
+        self._decoded: dict[int, dict[str, Any]] = {}
+        self._tail: list[dict[str, Any]] = []
+        self._items: list[dict[str, Any]] | None = None
+
+    @property
+    def _persisted(self) -> int:
+        return len(self._spans) // 2
+
+    def _decode(self, i: int) -> dict[str, Any]:
+        msg = self._decoded.get(i)
+        if msg is None:
+            msg = self._decoded[i] = _loads(self._buf[self._spans[2 * i]:self._spans[2 * i + 1]])
+        return msg
+
+    def _materialize(self) -> list[dict[str, Any]]:
+        if self._items is None:
+            self._items = [self._decode(i) for i in range(self._persisted)] + self._tail
+            self._buf, self._spans, self._decoded, self._tail = b"", array("Q"), {}, []
+        return self._items
+
+    def raw(self, i: int) -> bytes | None:
+        """Raw JSON of message i if it was never decoded (so is unchanged)."""
+        if self._items is None and i < self._persisted and i not in self._decoded:
+            return self._buf[self._spans[2 * i]:self._spans[2 * i + 1]]
+        return None
+
+    # ---------- sequence protocol ----------
+
+    def __len__(self) -> int:
+        if self._items is not None:
+            return len(self._items)
+        return self._persisted + len(self._tail)
+
+    def __getitem__(self, index):
+        if self._items is not None:
+            return self._items[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("message index out of range")
+
+        persisted = self._persisted
+        return self._decode(index) if index < persisted else self._tail[index - persisted]
+
+    def __setitem__(self, index, value) -> None:
+        if isinstance(index, slice) or self._items is not None:
+            self._materialize()[index] = value
+            return
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("message index out of range")
+
+        persisted = self._persisted
+        if index < persisted:
+            self._decoded[index] = value
+        else:
+            self._tail[index - persisted] = value
+
+    def __delitem__(self, index) -> None:
+        del self._materialize()[index]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        if self._items is not None:
+            return iter(self._items)
+        return (self[i] for i in range(len(self)))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyMessages)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"LazyMessages({len(self)} messages)"
+
+    def insert(self, index: int, value: dict[str, Any]) -> None:
+        self._materialize().insert(index, value)
+
+    def append(self, value: dict[str, Any]) -> None:
+        if self._items is not None:
+            self._items.append(value)
+        else:
+            self._tail.append(value)
+
+    def clear(self) -> None:
+        self._items = []
+        self._buf, self._spans, self._decoded, self._tail = b"", array("Q"), {}, []
+
 
 # ===========================
 # Session Object
@@ -39,20 +298,35 @@ class Session:
     """
 
     key: str
-    messages: list[dict[str, Any]] = field(default_factory=list)
+    messages: MutableSequence[dict[str, Any]] = field(default_factory=list)
     created_at: str = field(default_factory=now_iso)
     updated_at: str = field(default_factory=now_iso)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # Number of messages already on disk (managed by SessionManager).
+    _persisted_count: int = field(default=0, repr=False, compare=False)
+    # Running sha256 of the file bytes this session last read or wrote.
+    _disk_hash: Any = field(default=None, repr=False, compare=False)
+    # (st_size, st_mtime_ns) of the file as this session last left it.
+    _disk_stat: tuple[int, int] | None = field(default=None, repr=False, compare=False)
+    # Encoded metadata as written in the file header.
+    _disk_meta: bytes | None = field(default=None, repr=False, compare=False)
+    # append() calls since the last full save().
+    _appends: int = field(default=0, repr=False, compare=False)
+    # On-disk size written by the last full save() (0: unknown).
+    _base_size: int = field(default=0, repr=False, compare=False)
+
     def append(self, role: str, content: str, **extra: Any) -> None:
         """Append a new message."""
+        now = now_iso()
         self.messages.append({
             "role": role,
             "content": content,
-            "timestamp": now_iso(),
+            "timestamp": now,
             **extra
         })
-        self.updated_at = now_iso()
+        # Same stamp as the message: _load() recovers updated_at from it.
+        self.updated_at = now
 
     def history(self, max_messages: int = 50) -> list[dict[str, str]]:
         """Return recent messages in LLM format."""
@@ -62,6 +336,7 @@ class Session:
     def clear(self) -> None:
         """Clear session history."""
         self.messages.clear()
+        self._persisted_count = 0
         self.updated_at = now_iso()
 
 
@@ -80,111 +355,434 @@ class SessionManager:
     - lifecycle cleanup
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        *,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        use_compression: bool = True,
+    ):
         self.sessions_dir = RUNTIME_PATHS.sessions
-        self._cache: dict[str, Session] = {}
+        # zstd-compressed JSONL when zstandard is installed.
+        self.use_compression = use_compression and zstd is not None
+        self._zc = zstd.ZstdCompressor(level=ZSTD_LEVEL) if self.use_compression else None
+        # LRU: evicted sessions are reloaded from disk on next access.
+        self._cache: OrderedDict[str, Session] = OrderedDict()
+        self._cache_cap = cache_size
+        self._index_path = self.sessions_dir / INDEX_FILENAME
+        self._index_appends = 0
 
     # ---------- internal helpers ----------
 
-    def _path(self, key: str) -> Path:
+    def _path(self, key: str, compressed: bool | None = None) -> Path:
+        if compressed is None:
+            compressed = self.use_compression
         safe = safe_filename(key.replace(":", "_"))
-        return self.sessions_dir / f"{safe}.jsonl"
+        suffix = COMPRESSED_SUFFIX if compressed else SESSION_SUFFIX
+        return self.sessions_dir / f"{safe}{suffix}"
+
+    def _alt_path(self, key: str) -> Path:
+        """Path in the other format (written before compression was toggled)."""
+        return self._path(key, compressed=not self.use_compression)
+
+    def _encode(self, buf: bytes) -> bytes:
+        return self._zc.compress(buf) if self._zc else buf
+
+    def _cache_put(self, session: Session) -> None:
+        self._cache[session.key] = session
+        self._cache.move_to_end(session.key)
+        if len(self._cache) > self._cache_cap:
+            self._cache.popitem(last=False)
+
+    # ---------- metadata index ----------
+
+    def _index_record(self, entry: dict[str, Any]) -> None:
+        """
+        Append an entry to the index (last entry per key and per path wins).
+
+        The index is a rebuildable cache, so it is not fsynced.
+        """
+        try:
+            if not self._index_path.exists():
+                self._index_rewrite(self._scan_sessions())
+
+            fd = os.open(self._index_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                write_all(fd, _dumps(entry) + b"\n")
+            finally:
+                os.close(fd)
+
+            self._index_appends += 1
+            if self._index_appends >= INDEX_COMPACT_EVERY:
+                self._index_read()  # compacts when mostly superseded
+        except Exception as e:
+            logger.warning(f"Session index update failed: {e}")
+
+    def _index_rewrite(self, entries: list[dict[str, Any]]) -> None:
+        self._write_replace(self._index_path, _dumps_lines(entries))
+
+    def _index_read(self) -> list[dict[str, Any]] | None:
+        try:
+            with open(self._index_path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return None
+
+        latest: dict[str, dict[str, Any]] = {}
+        owner: dict[str, str] = {}  # path -> key of the entry listing it
+        lines = 0
+        for line in raw.splitlines():
+            if not line:
+                continue
+            lines += 1
+            try:
+                entry = _loads(line)
+            except ValueError:
+                continue
+
+            key = entry["key"]
+            if entry.get("deleted"):
+                latest.pop(key, None)
+                for p in entry.get("paths", ()):
+                    latest.pop(owner.pop(p, None), None)
+                continue
+
+            # One file, one entry: a scanned entry with a filename-derived
+            # key is superseded once the real key is recorded for its path.
+            path = entry.get("path")
+            prev = owner.get(path)
+            if prev is not None and prev != key:
+                latest.pop(prev, None)
+            old = latest.get(key)
+            if old is not None and owner.get(old.get("path")) == key:
+                del owner[old["path"]]
+            owner[path] = key
+            latest[key] = entry
+
+        entries = list(latest.values())
+
+        if lines > 2 * len(entries) + INDEX_COMPACT_SLACK:
+            self._index_rewrite(entries)
+        self._index_appends = 0
+
+        return entries
+
+    @staticmethod
+    def _index_entry(session: Session, path: Path) -> dict[str, Any]:
+        return {
+            "key": session.key,
+            "created_at": session.created_at,
+            "updated_at": session.updated_at,
+            "path": str(path),
+        }
 
     # ---------- core APIs ----------
 
     def get(self, key: str) -> Session:
         """Get or create a session."""
-        if key in self._cache:
-            return self._cache[key]
+        session = self._cache.get(key)
+        if session is not None:
+            self._cache.move_to_end(key)
+            return session
 
         session = self._load(key) or Session(key=key)
-        self._cache[key] = session
+        self._cache_put(session)
         return session
 
-    def save(self, session: Session) -> None:
-        """Persist session atomically."""
+    def save(self, session: Session) -> bool:
+        """
+        Persist session atomically.
+
+        Returns False if nothing was written: the file changed on disk
+        since this session last read or wrote it, or the write failed.
+        """
+        path = self._path(session.key)
+
+        try:
+            items: list[Any] = [{
+                "_type": "metadata",
+                "key": session.key,
+                "created_at": session.created_at,
+                "updated_at": session.updated_at,
+                "metadata": session.metadata,
+            }]
+            msgs = session.messages
+            if isinstance(msgs, LazyMessages):
+                # Untouched persisted messages are reused as raw bytes.
+                items.extend(msgs.raw(i) or msgs[i] for i in range(len(msgs)))
+            else:
+                items.extend(msgs)
+            buf = _dumps_lines(items)
+            digest = hashlib.sha256(buf)
+
+            known = session._disk_hash
+            if known is not None and known.digest() == digest.digest():
+                self._cache_put(session)
+                return True  # unchanged since last read/write
+
+            data = self._encode(buf)
+            try:
+                self._write_new(path, data)
+            except FileExistsError:
+                if known is not None and not self._disk_matches(path, session):
+                    logger.warning(
+                        f"Session save rejected (stale_precondition): {session.key}"
+                    )
+                    return False
+                self._write_replace(path, data)
+
+            self._alt_path(session.key).unlink(missing_ok=True)
+            fsync_dir(self.sessions_dir)
+            session._disk_hash = digest
+            session._disk_stat = self._stat(path)
+            session._disk_meta = _dumps(session.metadata)
+            session._appends = 0
+            session._base_size = len(data)
+            session._persisted_count = len(session.messages)
+            self._cache_put(session)
+            self._index_record(self._index_entry(session, path))
+            return True
+
+        except Exception as e:
+            logger.exception(f"Session save failed: {session.key}: {e}")
+            return False
+
+    def append(self, session: Session) -> bool:
+        """
+        Persist only the messages added since the last save.
+
+        Falls back to a full save() for sessions not yet on disk, whose
+        history was rewritten or whose metadata changed, and every
+        COMPACT_EVERY_APPENDS calls to compact the file and refresh its
+        header. Returns False if nothing was written (same precondition
+        as save()).
+        """
         path = self._path(session.key)
-        tmp = path.with_suffix(".tmp")
+        start = session._persisted_count
+
+        if (
+            not start
+            or start > len(session.messages)
+            or session._appends >= COMPACT_EVERY_APPENDS
+            or self._frames_outgrown(session)
+            or _dumps(session.metadata) != session._disk_meta
+            or not path.exists()
+        ):
+            return self.save(session)
+
+        new_messages = session.messages[start:]
+        if not new_messages:
+            return True
 
         try:
-            with open(tmp, "w", encoding="utf-8") as f:
-                f.write(json.dumps({
-                    "_type": "metadata",
-                    "created_at": session.created_at,
-                    "updated_at": session.updated_at,
-                    "metadata": session.metadata,
-                }) + "\n")
+            # Appending onto another writer's bytes would let the next
+            # save() match the new stat and overwrite their messages.
+            if session._disk_hash is not None and not self._disk_matches(path, session):
+                logger.warning(f"Session append rejected (stale_precondition): {session.key}")
+                return False
 
-                for msg in session.messages:
-                    f.write(json.dumps(msg, ensure_ascii=False) + "\n")
+            buf = _dumps_lines(new_messages)
 
-            tmp.replace(path)
-            self._cache[session.key] = session
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+            try:
+                write_all(fd, self._encode(buf))  # zstd: one extra frame
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+            if session._disk_hash is not None:
+                session._disk_hash.update(buf)
+            session._disk_stat = self._stat(path)
+            session._appends += 1
+            session._persisted_count = len(session.messages)
+            self._cache_put(session)
+            self._index_record(self._index_entry(session, path))
+            return True
 
         except Exception as e:
-            logger.exception(f"Session save failed: {session.key}: {e}")
+            logger.exception(f"Session append failed: {session.key}: {e}")
+            return False
+
+    def _frames_outgrown(self, session: Session) -> bool:
+        """Whether appended zstd frames cost more than recompressing."""
+        if not self._zc or not session._base_size or session._disk_stat is None:
+            return False
+        appended = session._disk_stat[0] - session._base_size
+        return appended > COMPACT_FRAME_RATIO * session._base_size
+
+    @staticmethod
+    def _stat(path: Path) -> tuple[int, int] | None:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    @classmethod
+    def _disk_matches(cls, path: Path, session: Session) -> bool:
+        """Whether path still holds the bytes session last read or wrote."""
+        stat = cls._stat(path)
+        if stat is None:
+            return False
+        if stat == session._disk_stat:
+            return True
+        # Size/mtime moved: only then pay for reading and hashing the file.
+        try:
+            return hashlib.sha256(_read_plain(path)).digest() == session._disk_hash.digest()
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _write_new(path: Path, buf: bytes) -> None:
+        """Cold path: create the file directly, no temp + rename needed."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            write_all(fd, buf)
+            os.fsync(fd)
+        except BaseException:
+            os.close(fd)
+            # Drop the partial file so the next save retakes this path.
+            path.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+
+    @staticmethod
+    def _write_replace(path: Path, buf: bytes) -> None:
+        """Overwrite an existing file via temp file + atomic rename."""
+        tmp = path.with_name(path.name + ".tmp")
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            write_all(fd, buf)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+        os.replace(tmp, path)
 
     def delete(self, key: str) -> bool:
         """Delete a session."""
         self._cache.pop(key, None)
-        path = self._path(key)
 
-        if path.exists():
-            path.unlink()
-            return True
-        return False
+        removed = False
+        for path in (self._path(key), self._alt_path(key)):
+            if path.exists():
+                path.unlink()
+                removed = True
+
+        if removed:
+            self._index_record({
+                "key": key,
+                "deleted": True,
+                "paths": [str(self._path(key)), str(self._alt_path(key))],
+            })
+        return removed
 
     def list(self) -> list[dict[str, Any]]:
         """List all sessions."""
-        sessions: list[dict[str, Any]] = []
+        sessions = self._index_read()
 
-        for path in self.sessions_dir.glob("*.jsonl"):
+        if sessions is None:
+            # Bootstrap: no index yet, scan session files once and persist.
+            sessions = self._scan_sessions()
             try:
-                with open(path, encoding="utf-8") as f:
-                    meta = json.loads(f.readline())
-
-                if meta.get("_type") == "metadata":
-                    sessions.append({
-                        "key": path.stem.replace("_", ":"),
-                        "created_at": meta.get("created_at"),
-                        "updated_at": meta.get("updated_at"),
-                        "path": str(path)
-                    })
-            except Exception:
-                continue
+                self._index_rewrite(sessions)
+            except Exception as e:
+                logger.warning(f"Session index bootstrap failed: {e}")
 
         return sorted(sessions, key=lambda x: x.get("updated_at") or "", reverse=True)
 
+    def _scan_sessions(self) -> list[dict[str, Any]]:
+        """Read metadata from every session file (index fallback)."""
+        with os.scandir(self.sessions_dir) as it:
+            paths = [
+                e.path for e in it
+                if e.name.endswith((SESSION_SUFFIX, COMPRESSED_SUFFIX))
+                and e.name != INDEX_FILENAME
+            ]
+
+        if len(paths) < SCAN_PARALLEL_MIN:
+            results = map(_read_meta, paths)
+        else:
+            # Reads release the GIL, so threads overlap per-file latency.
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_read_meta, paths))
+
+        return [meta for meta in results if meta is not None]
+
     # ---------- load ----------
 
     def _load(self, key: str) -> Session | None:
         path = self._path(key)
         if not path.exists():
-            return None
+            path = self._alt_path(key)
+            if not path.exists():
+                return None
 
         try:
-            messages: list[dict[str, Any]] = []
+            # Stat before reading: a write in between only forces a re-hash.
+            stat = self._stat(path)
+            buf = _map_file(path)
             metadata: dict[str, Any] = {}
             created_at: str | None = None
-
-            with open(path, encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-                    data = json.loads(line)
-
-                    if data.get("_type") == "metadata":
-                        metadata = data.get("metadata", {})
-                        created_at = data.get("created_at")
+            updated_at: str | None = None
+
+            # Index line spans, validating each: a corrupt line is dropped
+            # here, so len() and indices never shift once in use. Decoded
+            # values are discarded; messages decode again on access.
+            spans = array("Q")
+            last: Any = None
+            corrupt = 0
+            pos, size = 0, len(buf)
+            while pos < size:
+                nl = buf.find(b"\n", pos)
+                end = size if nl < 0 else nl
+                # Skip empty and lone-CR lines without slicing a copy.
+                if end - pos > 1 or (end > pos and buf[pos] != 13):
+                    try:
+                        last = _loads(buf[pos:end])
+                    except ValueError:
+                        corrupt += 1
                     else:
-                        messages.append(data)
+                        spans.extend((pos, end))
+                pos = end + 1
+
+            # Metadata is the first line; save() always writes it there.
+            if spans:
+                try:
+                    head = _loads(buf[spans[0]:spans[1]])
+                except ValueError:
+                    head = None
+                if isinstance(head, dict) and head.get("_type") == "metadata":
+                    metadata = head.get("metadata", {})
+                    created_at = head.get("created_at")
+                    updated_at = head.get("updated_at")
+                    del spans[:2]
+
+            # A torn append or damaged line must not lose the whole session.
+            if corrupt:
+                logger.warning(f"Skipping {corrupt} corrupt line(s) in session {key}")
+
+            # The header is only refreshed on save(); appended messages
+            # carry the newer timestamp.
+            stamp = last.get("timestamp") if spans and isinstance(last, dict) else None
+            if isinstance(stamp, str) and stamp > (updated_at or ""):
+                updated_at = stamp
+
+            messages = LazyMessages(buf, spans)
 
             return Session(
                 key=key,
                 messages=messages,
                 created_at=created_at or now_iso(),
-                updated_at=now_iso(),
+                # Keep the on-disk value so an unchanged session saves as a no-op.
+                updated_at=updated_at or now_iso(),
                 metadata=metadata,
+                # Damaged files get rewritten by the next append().
+                _persisted_count=0 if corrupt else len(messages),
+                _disk_hash=hashlib.sha256(buf),
+                _disk_stat=stat,
+                _disk_meta=_dumps(metadata),
+                _base_size=stat[0] if stat else 0,
             )
 
         except Exception as e:
@@ -21,16 +21,6 @@ class Tool(ABC):
     - Callable by agents via structured arguments
     """
 
-    # JSON Schema → Python runtime type mapping
-    _TYPE_MAP: Dict[str, Any] = {
-        "string": str,
-        "integer": int,
-        "number": (int, float),
-        "boolean": bool,
-        "array": list,
-        "object": dict,
-    }
-
     # ---------
     # Identity
     # ---------
@@ -108,56 +98,80 @@ class Tool(ABC):
         return self._validate(params, {**schema, "type": "object"}, path="")
 
     def _validate(self, value: Any, schema: Dict[str, Any], path: str) -> List[str]:
-        errors: List[str] = []
         expected_type = schema.get("type")
         label = path or "parameter"
 
-        if expected_type in self._TYPE_MAP:
-            if not isinstance(value, self._TYPE_MAP[expected_type]):
-                return [f"{label} should be {expected_type}"]
+        # One branch per schema node: type check and constraints together.
+        match expected_type:
+            case "string":
+                if not isinstance(value, str):
+                    return [f"{label} should be string"]
+                errors = self._enum_errors(value, schema, label)
+                if "minLength" in schema and len(value) < schema["minLength"]:
+                    errors.append(f"{label} must be at least {schema['minLength']} characters")
+                if "maxLength" in schema and len(value) > schema["maxLength"]:
+                    errors.append(f"{label} must be at most {schema['maxLength']} characters")
+
+            case "integer" | "number":
+                # bool is an int subclass, but not a JSON Schema number.
+                if isinstance(value, bool) or not isinstance(
+                    value, int if expected_type == "integer" else (int, float)
+                ):
+                    return [f"{label} should be {expected_type}"]
+                errors = self._enum_errors(value, schema, label)
+                if "minimum" in schema and value < schema["minimum"]:
+                    errors.append(f"{label} must be >= {schema['minimum']}")
+                if "maximum" in schema and value > schema["maximum"]:
+                    errors.append(f"{label} must be <= {schema['maximum']}")
+
+            case "boolean":
+                if not isinstance(value, bool):
+                    return [f"{label} should be boolean"]
+                errors = self._enum_errors(value, schema, label)
+
+            case "object":
+                if not isinstance(value, dict):
+                    return [f"{label} should be object"]
+                errors = self._enum_errors(value, schema, label)
+                props = schema.get("properties", {})
+                for key in schema.get("required", []):
+                    if key not in value:
+                        errors.append(f"missing required {path + '.' + key if path else key}")
+                for key, val in value.items():
+                    if key in props:
+                        errors.extend(
+                            self._validate(
+                                val,
+                                props[key],
+                                f"{path}.{key}" if path else key,
+                            )
+                        )
 
-        if "enum" in schema and value not in schema["enum"]:
-            errors.append(f"{label} must be one of {schema['enum']}")
-
-        if expected_type in ("integer", "number"):
-            if "minimum" in schema and value < schema["minimum"]:
-                errors.append(f"{label} must be >= {schema['minimum']}")
-            if "maximum" in schema and value > schema["maximum"]:
-                errors.append(f"{label} must be <= {schema['maximum']}")
-
-        if expected_type == "string":
-            if "minLength" in schema and len(value) < schema["minLength"]:
-                errors.append(f"{label} must be at least {schema['minLength']} characters")
-            if "maxLength" in schema and len(value) > schema["maxLength"]:
-                errors.append(f"{label} must be at most {schema['maxLength']} characters")
-
-        if expected_type == "object":
-            props = schema.get("properties", {})
-            for key in schema.get("required", []):
-                if key not in value:
-                    errors.append(f"missing required {path + '.' + key if path else key}")
-            for key, val in value.items():
-                if key in props:
-                    errors.extend(
-                        self._validate(
-                            val,
-                            props[key],
-                            f"{path}.{key}" if path else key,
+            case "array":
+                if not isinstance(value, list):
+                    return [f"{label} should be array"]
+                errors = self._enum_errors(value, schema, label)
+                if "items" in schema:
+                    for idx, item in enumerate(value):
+                        errors.extend(
+                            self._validate(
+                                item,
+                                schema["items"],
+                                f"{path}[{idx}]" if path else f"[{idx}]",
+                            )
                         )
-                    )
-
-        if expected_type == "array" and "items" in schema:
-            for idx, item in enumerate(value):
-                errors.extend(
-                    self._validate(
-                        item,
-                        schema["items"],
-                        f"{path}[{idx}]" if path else f"[{idx}]",
-                    )
-                )
+
+            case _:
+                errors = self._enum_errors(value, schema, label)
 
         return errors
 
+    @staticmethod
+    def _enum_errors(value: Any, schema: Dict[str, Any], label: str) -> List[str]:
+        if "enum" in schema and value not in schema["enum"]:
+            return [f"{label} must be one of {schema['enum']}"]
+        return []
+
     # -----------------
     # LLM Integration
     # -----------------
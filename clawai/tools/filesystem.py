@@ -5,20 +5,170 @@ These tools provide side-effect aware capabilities for agents to
 interact with the local filesystem in a safe, traceable manner.
 """
 
+import asyncio
+import hashlib
+import mmap
+import os
 from pathlib import Path
 from typing import Any
 
 from clawai.tools.base import Tool
+from clawai.utils.helpers import fsync_dir, write_all
 
 
 # =========================
 # Internal helpers
 # =========================
 
+# Files at least this large are memory-mapped instead of read whole.
+MMAP_THRESHOLD = 1 << 20
+
 def _resolve_path(path: str) -> Path:
+    # Not cached: a stale resolution would hide a changed symlink.
     return Path(path).expanduser().resolve()
 
 
+def _list_entries(dir_path: Path) -> str:
+    # DirEntry.is_dir() uses the cached dirent type: no stat for most entries.
+    with os.scandir(dir_path) as it:
+        items = sorted(it, key=lambda e: e.name)
+    return "\n".join(
+        f"{'📁' if e.is_dir() else '📄'} {e.name}" for e in items
+    )
+
+
+def _read_text(file_path: Path) -> str:
+    """read_text() equivalent that decodes large files from an mmap."""
+    if file_path.stat().st_size < MMAP_THRESHOLD:
+        return file_path.read_text(encoding="utf-8")
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = str(mm, "utf-8")
+        has_cr = mm.find(b"\r") >= 0
+
+    if has_cr:  # match read_text()'s universal-newline translation
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _edit_mmap(file_path: Path, old_text: str, new_text: str) -> int | None:
+    """
+    Replace a unique occurrence by searching raw bytes of a mapped file.
+
+    Returns the number of matches seen (0, 1, or 2 meaning "several"), or
+    None for files containing "\r": the text path normalizes those to LF,
+    and edits must give the same bytes whatever the file size. Only valid
+    for single-line old/new text, where byte matching agrees with
+    text-mode matching.
+    """
+    old = old_text.encode("utf-8")
+
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if mm.find(b"\r") >= 0:
+            return None
+        idx = mm.find(old)
+        if idx < 0:
+            return 0
+        end = idx + len(old)
+        if mm.find(old, end) >= 0:
+            return 2
+        if old_text == new_text:
+            return 1
+        updated = b"".join((mm[:idx], new_text.encode("utf-8"), mm[end:]))
+
+    _atomic_write(file_path, updated)
+    return 1
+
+
+def _temp_sibling(file_path: Path) -> Path:
+    return file_path.with_name(f".{file_path.name}.{os.urandom(4).hex()}.tmp")
+
+
+def _write_verified(fd: int, data: bytes) -> None:
+    """Write + fsync, then read back and compare hashes before publishing."""
+    write_all(fd, data)
+    os.fsync(fd)
+
+    h = hashlib.sha256()
+    offset = 0
+    while chunk := os.pread(fd, 1 << 16, offset):
+        h.update(chunk)
+        offset += len(chunk)
+    if h.digest() != hashlib.sha256(data).digest():
+        raise OSError(f"write verification failed for {fd}")
+
+
+def _write_tmpfile(file_path: Path, data: bytes, mode: int | None) -> bool:
+    """
+    Linux fast path: write into an unnamed O_TMPFILE inode, then link it
+    into place. Returns False if the kernel/filesystem cannot do this.
+    """
+    try:
+        fd = os.open(file_path.parent, os.O_TMPFILE | os.O_RDWR, 0o666)
+    except OSError:
+        return False
+
+    try:
+        if mode is not None:
+            os.fchmod(fd, mode)
+        _write_verified(fd, data)
+
+        # A dir fd makes os.link use linkat(AT_SYMLINK_FOLLOW), which is
+        # required to link the inode behind the /proc magic symlink.
+        proc_path = f"/proc/self/fd/{fd}"
+        dir_fd = os.open(file_path.parent, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            try:
+                os.link(proc_path, file_path.name, dst_dir_fd=dir_fd)
+            except FileExistsError:
+                # linkat cannot replace a name: link beside it, then rename over.
+                tmp = _temp_sibling(file_path)
+                os.link(proc_path, tmp.name, dst_dir_fd=dir_fd)
+                os.replace(tmp, file_path)
+            os.fsync(dir_fd)
+        except OSError:
+            return False  # e.g. /proc not mounted: use the portable path
+        finally:
+            os.close(dir_fd)
+    finally:
+        os.close(fd)
+
+    return True
+
+
+def _write_renamed(file_path: Path, data: bytes, mode: int | None) -> None:
+    """Portable path: named temp file + fsync + atomic rename."""
+    tmp = _temp_sibling(file_path)
+    fd = os.open(tmp, os.O_RDWR | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        _write_verified(fd, data)
+    except BaseException:
+        os.close(fd)
+        tmp.unlink(missing_ok=True)
+        raise
+    os.close(fd)
+
+    if mode is not None:
+        os.chmod(tmp, mode)
+    os.replace(tmp, file_path)
+    fsync_dir(file_path.parent)
+
+
+def _atomic_write(file_path: Path, data: bytes) -> None:
+    """
+    Crash-safe write: readers see either the old file or the complete new
+    one, never a truncated file. Existing permission bits are kept.
+    """
+    try:
+        mode = file_path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+
+    if hasattr(os, "O_TMPFILE") and _write_tmpfile(file_path, data, mode):
+        return
+    _write_renamed(file_path, data, mode)
+
+
 def _error(message: str) -> str:
     return f"Error: {message}"
 
@@ -64,7 +214,7 @@ class ReadFileTool(Tool):
             if not file_path.is_file():
                 return _error(f"not a file: {path}")
 
-            content = file_path.read_text(encoding="utf-8")
+            content = await asyncio.to_thread(_read_text, file_path)
             return content
 
         except PermissionError:
@@ -113,7 +263,7 @@ class WriteFileTool(Tool):
             file_path = _resolve_path(path)
             file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            file_path.write_text(content, encoding="utf-8")
+            await asyncio.to_thread(_atomic_write, file_path, content.encode("utf-8"))
 
             return _ok(
                 f"Wrote {len(content)} characters to {file_path}"
@@ -179,19 +329,39 @@ class EditFileTool(Tool):
             if not file_path.is_file():
                 return _error(f"not a file: {path}")
 
-            content = file_path.read_text(encoding="utf-8")
-
-            occurrences = content.count(old_text)
-            if occurrences == 0:
+            if (
+                old_text
+                and not any(c in old_text or c in new_text for c in "\r\n")
+                and file_path.stat().st_size >= MMAP_THRESHOLD
+            ):
+                matches = await asyncio.to_thread(_edit_mmap, file_path, old_text, new_text)
+                if matches == 0:
+                    return _error("old_text not found in file")
+                if matches == 1:
+                    return _ok(f"Edited file successfully: {file_path}")
+                if matches is not None:
+                    return (
+                        "Warning: old_text appears multiple times. "
+                        "Please provide a more specific match."
+                    )
+                # None: CR line endings, edited on the text path below.
+
+            content = await asyncio.to_thread(_read_text, file_path)
+
+            idx = content.find(old_text)
+            if idx < 0:
                 return _error("old_text not found in file")
-            if occurrences > 1:
+            end = idx + len(old_text)
+            # Stop at the second occurrence instead of counting them all.
+            if content.find(old_text, end if old_text else idx + 1) >= 0:
                 return (
-                    f"Warning: old_text appears {occurrences} times. "
+                    "Warning: old_text appears multiple times. "
                     "Please provide a more specific match."
                 )
 
-            updated = content.replace(old_text, new_text, 1)
-            file_path.write_text(updated, encoding="utf-8")
+            if old_text != new_text:
+                updated = content[:idx] + new_text + content[end:]
+                await asyncio.to_thread(file_path.write_text, updated, encoding="utf-8")
 
             return _ok(f"Edited file successfully: {file_path}")
 
@@ -238,15 +408,12 @@ class ListDirTool(Tool):
             if not dir_path.is_dir():
                 return _error(f"not a directory: {path}")
 
-            entries = []
-            for item in sorted(dir_path.iterdir()):
-                icon = "📁" if item.is_dir() else "📄"
-                entries.append(f"{icon} {item.name}")
+            listing = await asyncio.to_thread(_list_entries, dir_path)
 
-            if not entries:
+            if not listing:
                 return f"Directory is empty: {dir_path}"
 
-            return "\n".join(entries)
+            return listing
 
         except PermissionError:
             return _error(f"permission denied: {path}")
@@ -5,10 +5,84 @@ Manages tool registration, schema exposure, and execution routing
 for agent tool calls.
 """
 
-from typing import Any
+from typing import Any, Callable
 
 from clawai.tools.base import Tool
 
+try:
+    import fastjsonschema
+except ImportError:  # optional: fall back to Tool.validate
+    fastjsonschema = None
+
+
+Validator = Callable[[dict[str, Any]], list[str]]
+
+# Property keys that do not constrain the value.
+_ANNOTATION_KEYS = frozenset({"type", "description", "title"})
+
+
+def _string_only_validator(schema: dict[str, Any]) -> Validator | None:
+    """
+    Specialized validator for schemas made only of plain string fields.
+
+    Returns None if any property is not an unconstrained string, or the
+    object schema itself carries constraints.
+    """
+    if set(schema) - {"type", "properties", "required"}:
+        return None
+
+    props = schema.get("properties", {})
+    for prop in props.values():
+        if prop.get("type") != "string" or set(prop) - _ANNOTATION_KEYS:
+            return None
+
+    required = tuple(schema.get("required", ()))
+    names = tuple(props)
+
+    def validate(params: dict[str, Any]) -> list[str]:
+        errors = [f"missing required {k}" for k in required if k not in params]
+        for k in names:
+            if k in params and not isinstance(params[k], str):
+                errors.append(f"{k} should be string")
+        return errors
+
+    return validate
+
+
+def _compile_validator(tool: Tool) -> Validator:
+    """
+    Build a parameter validator for a tool, once, at registration.
+
+    Plain all-string schemas get an inline check; others use a
+    fastjsonschema-compiled function when available, otherwise the
+    interpreted Tool.validate(). Defaults are not injected: validation
+    must never mutate the params handed to the tool.
+    """
+    schema = tool.parameters or {}
+    if schema.get("type", "object") != "object":
+        return tool.validate
+
+    fast = _string_only_validator(schema)
+    if fast is not None:
+        return fast
+
+    if fastjsonschema is None:
+        return tool.validate
+
+    try:
+        compiled = fastjsonschema.compile({**schema, "type": "object"}, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return tool.validate
+
+    def validate(params: dict[str, Any]) -> list[str]:
+        try:
+            compiled(params)
+        except fastjsonschema.JsonSchemaException as e:
+            return [str(e)]
+        return []
+
+    return validate
+
 
 class ToolRegistry:
     """
@@ -20,6 +94,10 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
+        # Tool schemas are constant per instance: build once at register().
+        self._schemas: dict[str, dict[str, Any]] = {}
+        self._definitions: list[dict[str, Any]] | None = None
+        self._validators: dict[str, Validator] = {}
 
     # =========================
     # Registration
@@ -28,10 +106,16 @@ class ToolRegistry:
     def register(self, tool: Tool) -> None:
         """Register a tool instance."""
         self._tools[tool.name] = tool
+        self._schemas[tool.name] = tool.to_schema()
+        self._validators[tool.name] = _compile_validator(tool)
+        self._definitions = None
 
     def unregister(self, name: str) -> None:
         """Remove a tool by name."""
         self._tools.pop(name, None)
+        self._schemas.pop(name, None)
+        self._validators.pop(name, None)
+        self._definitions = None
 
     def get(self, name: str) -> Tool | None:
         """Retrieve a tool by name."""
@@ -48,8 +132,12 @@ class ToolRegistry:
     def get_definitions(self) -> list[dict[str, Any]]:
         """
         Return tool schemas in LLM-compatible format.
+
+        The list is cached and shared between calls; do not mutate it.
         """
-        return [tool.to_schema() for tool in self._tools.values()]
+        if self._definitions is None:
+            self._definitions = list(self._schemas.values())
+        return self._definitions
 
     # =========================
     # Execution
@@ -72,7 +160,7 @@ class ToolRegistry:
 
         # Parameter validation
         try:
-            errors = tool.validate_params(params)
+            errors = self._validators[name](params)
         except Exception as e:
             return f"Error: invalid schema for tool '{name}': {e}"
 
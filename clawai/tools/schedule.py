@@ -9,7 +9,7 @@ ClawAI Agent style:
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any
 
 from clawai.tools.base import Tool
 from clawai.cron.service import CronService
@@ -62,12 +62,6 @@ class CronTool(Tool):
         self._channel: str | None = None
         self._chat_id: str | None = None
 
-        self._handlers: dict[str, Callable[..., dict[str, Any]]] = {
-            "add": self._handle_add,
-            "list": self._handle_list,
-            "remove": self._handle_remove,
-        }
-
     # ---------------------------------------------------------------------
     # Context
     # ---------------------------------------------------------------------
@@ -89,14 +83,22 @@ class CronTool(Tool):
     async def execute(
         self,
         action: str,
-        **kwargs: Any,
+        message: str | None = None,
+        every_seconds: int | None = None,
+        cron_expr: str | None = None,
+        job_id: str | None = None,
+        **_: Any,
     ) -> str:
-        handler = self._handlers.get(action)
-        if not handler:
-            return self._error(f"Unknown action: {action}")
-
         try:
-            result = handler(**kwargs)
+            match action:
+                case "add":
+                    result = self._handle_add(message, every_seconds, cron_expr)
+                case "list":
+                    result = self._handle_list()
+                case "remove":
+                    result = self._handle_remove(job_id)
+                case _:
+                    return self._error(f"Unknown action: {action}")
             return self._ok(result)
         except Exception as exc:
             return self._error(str(exc))
@@ -107,10 +109,9 @@ class CronTool(Tool):
 
     def _handle_add(
         self,
-        message: str | None = None,
-        every_seconds: int | None = None,
-        cron_expr: str | None = None,
-        **_: Any,
+        message: str | None,
+        every_seconds: int | None,
+        cron_expr: str | None,
     ) -> dict[str, Any]:
         if not message:
             raise ValueError("message is required for add")
@@ -147,7 +148,7 @@ class CronTool(Tool):
             "schedule": schedule.kind,
         }
 
-    def _handle_list(self, **_: Any) -> dict[str, Any]:
+    def _handle_list(self) -> dict[str, Any]:
         jobs = self._cron.list_jobs()
         return {
             "count": len(jobs),
@@ -161,7 +162,7 @@ class CronTool(Tool):
             ],
         }
 
-    def _handle_remove(self, job_id: str | None = None, **_: Any) -> dict[str, Any]:
+    def _handle_remove(self, job_id: str | None) -> dict[str, Any]:
         if not job_id:
             raise ValueError("job_id is required for remove")
 
@@ -6,13 +6,62 @@ with workspace-aware safety checks.
 """
 
 import asyncio
+import functools
 import os
 import re
+import shlex
 from pathlib import Path
 from typing import Any
 
 from clawai.tools.base import Tool
 
+# Absolute paths mentioned in a command (Windows drive paths, POSIX paths)
+_WIN_PATH_RE = re.compile(r"[A-Za-z]:\\[^\\\"']+")
+_POSIX_PATH_RE = re.compile(r"/[^\s\"']+")
+
+# Output cap: max_len chars reach the agent, and no more than 4 bytes per
+# char can survive it, so capture stops keeping bytes past that.
+MAX_OUTPUT_CHARS = 10_000
+MAX_OUTPUT_BYTES = MAX_OUTPUT_CHARS * 4
+READ_CHUNK_SIZE = 65536
+
+# Anything that needs /bin/sh to interpret (pipes, redirects, expansion, ...)
+_SHELL_META = frozenset("|&;<>$`()*?[]{}~#!\\\n")
+
+
+@functools.lru_cache(maxsize=128)
+def _resolved_cwd(cwd: str) -> Path:
+    return Path(cwd).resolve()
+
+
+async def _read_bounded(stream: asyncio.StreamReader, limit: int) -> tuple[bytes, int]:
+    """
+    Drain a stream to EOF keeping only the first `limit` bytes.
+
+    Returns (kept bytes, number of bytes discarded).
+    """
+    buf = bytearray()
+    discarded = 0
+    while chunk := await stream.read(READ_CHUNK_SIZE):
+        room = limit - len(buf)
+        if room > 0:
+            buf += chunk[:room]
+        discarded += max(len(chunk) - max(room, 0), 0)
+    return bytes(buf), discarded
+
+
+def _simple_argv(command: str) -> list[str] | None:
+    """Split a command that needs no shell features into argv, else None."""
+    if os.name != "posix" or not _SHELL_META.isdisjoint(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:  # unbalanced quotes
+        return None
+    if not argv or "=" in argv[0]:  # VAR=value prefix
+        return None
+    return argv
+
 
 class ExecTool(Tool):
     """
@@ -50,6 +99,10 @@ class ExecTool(Tool):
         # Optional allowlist (if provided, must match at least one)
         self.allow_patterns = allow_patterns or []
 
+        # One alternation per list, so a command is scanned once per guard
+        self._deny_re = self._combine(self.deny_patterns)
+        self._allow_re = self._combine(self.allow_patterns)
+
     # =========================
     # Tool interface
     # =========================
@@ -99,16 +152,17 @@ class ExecTool(Tool):
             return guard_error
 
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                cwd=cwd,
-            )
+            process = await self._spawn(command, cwd)
 
+            # Pipes are drained to EOF so the child never blocks on a full
+            # pipe, but memory stays bounded however much it prints.
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(),
+                (stdout, out_dropped), (stderr, err_dropped), _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_bounded(process.stdout, MAX_OUTPUT_BYTES),
+                        _read_bounded(process.stderr, MAX_OUTPUT_BYTES),
+                        process.wait(),
+                    ),
                     timeout=self.timeout,
                 )
             except asyncio.TimeoutError:
@@ -119,6 +173,7 @@ class ExecTool(Tool):
                 stdout=stdout,
                 stderr=stderr,
                 returncode=process.returncode,
+                discarded=out_dropped + err_dropped,
             )
 
         except Exception as e:
@@ -128,34 +183,60 @@ class ExecTool(Tool):
     # Safety & helpers
     # =========================
 
+    @staticmethod
+    def _combine(patterns: list[str]) -> re.Pattern[str] | None:
+        """Compile patterns into one case-insensitive alternation (None if empty)."""
+        if not patterns:
+            return None
+        return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+    async def _spawn(self, command: str, cwd: str) -> asyncio.subprocess.Process:
+        """
+        Start the command, without an intermediate shell when possible.
+        """
+        argv = _simple_argv(command)
+        if argv:
+            try:
+                return await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    cwd=cwd,
+                )
+            except OSError:
+                pass  # builtins (cd, export) or missing binaries: let sh report it
+
+        return await asyncio.create_subprocess_shell(
+            command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
+
     def _check_command_safety(self, command: str, cwd: str) -> str | None:
         """
         Perform best-effort safety checks on the command.
         """
         cmd = command.strip()
-        lower = cmd.lower()
 
         # Denylist
-        for pattern in self.deny_patterns:
-            if re.search(pattern, lower):
-                return "Error: command blocked by safety guard (dangerous pattern detected)"
+        if self._deny_re is not None and self._deny_re.search(cmd):
+            return "Error: command blocked by safety guard (dangerous pattern detected)"
 
         # Allowlist (if configured)
-        if self.allow_patterns:
-            if not any(re.search(p, lower) for p in self.allow_patterns):
-                return "Error: command blocked by safety guard (not in allowlist)"
+        if self._allow_re is not None and not self._allow_re.search(cmd):
+            return "Error: command blocked by safety guard (not in allowlist)"
 
         # Workspace restriction
         if self.restrict_to_workspace:
             if "../" in cmd or "..\\" in cmd:
                 return "Error: command blocked (path traversal detected)"
 
-            cwd_path = Path(cwd).resolve()
+            # Working directories repeat; command paths are resolved fresh
+            # every time, since a cached result could hide a new symlink.
+            cwd_path = _resolved_cwd(cwd)
 
-            paths = (
-                re.findall(r"[A-Za-z]:\\[^\\\"']+", cmd)
-                + re.findall(r"/[^\s\"']+", cmd)
-            )
+            paths = _WIN_PATH_RE.findall(cmd) + _POSIX_PATH_RE.findall(cmd)
 
             for raw in paths:
                 try:
@@ -174,17 +255,28 @@ class ExecTool(Tool):
         stdout: bytes | None,
         stderr: bytes | None,
         returncode: int,
+        discarded: int = 0,
     ) -> str:
         """
         Normalize and truncate process output.
+
+        `discarded` counts bytes already dropped while capturing.
         """
+        # Hard cap output size; bytes that cannot survive it are dropped
+        # before decoding.
+        max_len = MAX_OUTPUT_CHARS
+        max_bytes = MAX_OUTPUT_BYTES
+        dropped = discarded
+
         parts: list[str] = []
 
         if stdout:
-            parts.append(stdout.decode("utf-8", errors="replace"))
+            dropped += max(len(stdout) - max_bytes, 0)
+            parts.append(stdout[:max_bytes].decode("utf-8", errors="replace"))
 
         if stderr:
-            err = stderr.decode("utf-8", errors="replace").strip()
+            dropped += max(len(stderr) - max_bytes, 0)
+            err = stderr[:max_bytes].decode("utf-8", errors="replace").strip()
             if err:
                 parts.append(f"STDERR:\n{err}")
 
@@ -193,9 +285,10 @@ class ExecTool(Tool):
 
         result = "\n".join(parts) if parts else "(no output)"
 
-        # Hard cap output size
-        max_len = 10_000
-        if len(result) > max_len:
+        if dropped:
+            more = len(result[max_len:].encode("utf-8", errors="replace")) + dropped
+            result = result[:max_len] + f"\n... (truncated, {more} more bytes)"
+        elif len(result) > max_len:
             result = (
                 result[:max_len]
                 + f"\n... (truncated, {len(result) - max_len} more chars)"
@@ -9,7 +9,11 @@ ClawAI Agent style:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import html
+import http.cookiejar
+import importlib.util
 import json
 import os
 import re
@@ -20,6 +24,30 @@ import httpx
 
 from clawai.tools.base import Tool
 
+try:
+    import orjson
+
+    def _dumps(obj: Any, *, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - stdlib fallback
+    def _dumps(obj: Any, *, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+    _loads = json.loads
+
+try:
+    from readability import Document
+except ImportError:  # pragma: no cover - optional dependency
+    Document = None
+
+try:
+    from resiliparse.extract.html2text import extract_plain_text
+    from resiliparse.parse.html import HTMLTree
+except ImportError:  # pragma: no cover - optional dependency
+    HTMLTree = None
+
 
 # =============================================================================
 # Constants
@@ -30,23 +58,42 @@ DEFAULT_TIMEOUT = 30.0
 MAX_REDIRECTS = 5
 MAX_SEARCH_RESULTS = 10
 
+# web_fetch stops downloading after max_chars * FETCH_BYTES_PER_CHAR bytes;
+# HTML markup typically shrinks several-fold once converted to text.
+FETCH_BYTES_PER_CHAR = 8
+FETCH_CHUNK_SIZE = 65536
+
+# Leading bytes inspected to detect HTML served without a text/html type
+SNIFF_BYTES = 256
+HTML_SIGNATURES = (b"<!doctype", b"<html")
+
+SEARCH_TIMEOUT = 10.0
+MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 # =============================================================================
 # Text utilities
 # =============================================================================
 
-_SCRIPT_RE = re.compile(r"<script[\s\S]*?</script>", re.I)
-_STYLE_RE = re.compile(r"<style[\s\S]*?</style>", re.I)
+# Script/style blocks go first: folded into the tag alternation, a stray
+# "<" before a block would match as a tag and leak the block's body.
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)[\s\S]*?</\1>", re.I)
 _TAG_RE = re.compile(r"<[^>]+>")
 _WS_RE = re.compile(r"[ \t]+")
 _NL_RE = re.compile(r"\n{3,}")
 
+# HTML → markdown rewrites
+_A_TAG_RE = re.compile(r'<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>', re.I | re.S)
+_H_TAG_RE = re.compile(r"<h([1-6])[^>]*>(.*?)</h\1>", re.I | re.S)
+_LI_TAG_RE = re.compile(r"<li[^>]*>(.*?)</li>", re.I | re.S)
+_BLOCK_END_RE = re.compile(r"</(p|div|section|article)>", re.I)
+_BR_HR_RE = re.compile(r"<(br|hr)\s*/?>", re.I)
+
 
 def strip_html(text: str) -> str:
     """Remove HTML tags and decode entities."""
-    text = _SCRIPT_RE.sub("", text)
-    text = _STYLE_RE.sub("", text)
-    text = _TAG_RE.sub("", text)
+    text = _TAG_RE.sub("", _SCRIPT_STYLE_RE.sub("", text))
     return html.unescape(text).strip()
 
 
@@ -56,10 +103,79 @@ def normalize_text(text: str) -> str:
     return _NL_RE.sub("\n\n", text).strip()
 
 
+# =============================================================================
+# Shared HTTP client
+# =============================================================================
+
+_client: httpx.AsyncClient | None = None
+_client_loop: asyncio.AbstractEventLoop | None = None
+# Close tasks for replaced clients, referenced until they finish.
+_closing: set[Any] = set()
+
+
+def _no_cookies() -> http.cookiejar.CookieJar:
+    """A jar that refuses every cookie: the client is shared across users."""
+    return http.cookiejar.CookieJar(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+
+async def _close_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception:
+        # Connections bound to a closed loop fail to close cleanly; their
+        # sockets are released when the transports are finalized.
+        pass
+
+
+def _retire(client: httpx.AsyncClient, owner: asyncio.AbstractEventLoop | None) -> None:
+    """Close a client replaced after an event loop change."""
+    if client.is_closed:
+        return
+    if owner is not None and owner.is_running():
+        # Owner loop lives on (another thread): close it there.
+        fut = asyncio.run_coroutine_threadsafe(_close_quietly(client), owner)
+    else:
+        fut = asyncio.get_running_loop().create_task(_close_quietly(client))
+    _closing.add(fut)
+    fut.add_done_callback(_closing.discard)
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Pooled client shared by the web tools, recreated per event loop."""
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        if _client is not None:
+            _retire(_client, _client_loop)
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+            follow_redirects=True,
+            max_redirects=MAX_REDIRECTS,
+            timeout=DEFAULT_TIMEOUT,
+            headers={"User-Agent": USER_AGENT},
+            cookies=_no_cookies(),
+        )
+        _client_loop = loop
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared HTTP client (call on shutdown)."""
+    global _client, _client_loop
+
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+
+
 # =============================================================================
 # URL validation
 # =============================================================================
 
+@functools.lru_cache(maxsize=4096)
 def validate_url(url: str) -> tuple[bool, str]:
     """Validate URL format and scheme."""
     try:
@@ -112,24 +228,24 @@ class WebSearchTool(Tool):
         **_: Any,
     ) -> str:
         if not self._api_key:
-            return json.dumps({"error": "BRAVE_API_KEY not configured"})
+            return _dumps({"error": "BRAVE_API_KEY not configured"})
 
         n = min(max(count or self._default_count, 1), MAX_SEARCH_RESULTS)
 
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                resp = await client.get(
-                    "",
-                    params={"q": query, "count": n},
-                    headers={
-                        "Accept": "application/json",
-                        "X-Subscription-Token": self._api_key,
-                        "User-Agent": USER_AGENT,
-                    },
-                )
-                resp.raise_for_status()
+            resp = await _get_client().get(
+                "",
+                params={"q": query, "count": n},
+                headers={
+                    "Accept": "application/json",
+                    "X-Subscription-Token": self._api_key,
+                },
+                timeout=SEARCH_TIMEOUT,
+                follow_redirects=False,
+            )
+            resp.raise_for_status()
 
-            results = resp.json().get("web", {}).get("results", [])
+            results = _loads(resp.content).get("web", {}).get("results", [])
             items = [
                 {
                     "rank": i + 1,
@@ -140,17 +256,16 @@ class WebSearchTool(Tool):
                 for i, r in enumerate(results[:n])
             ]
 
-            return json.dumps(
+            return _dumps(
                 {
                     "query": query,
                     "count": len(items),
                     "results": items,
                 },
-                ensure_ascii=False,
             )
 
         except Exception as exc:
-            return json.dumps({"error": str(exc), "query": query})
+            return _dumps({"error": str(exc), "query": query})
 
 
 # =============================================================================
@@ -162,6 +277,7 @@ class WebFetchTool(Tool):
     Fetch a URL and extract readable content.
 
     - HTML → Readability → markdown / text
+    - HTML → Resiliparse → text (when installed)
     - JSON passthrough
     """
 
@@ -198,55 +314,59 @@ class WebFetchTool(Tool):
         maxChars: int | None = None,
         **_: Any,
     ) -> str:
-        from readability import Document
-
         max_chars = maxChars or self._default_max_chars
 
         valid, error = validate_url(url)
         if not valid:
-            return json.dumps({"error": error, "url": url})
+            return _dumps({"error": error, "url": url})
 
         try:
-            async with httpx.AsyncClient(
-                follow_redirects=True,
-                max_redirects=MAX_REDIRECTS,
-                timeout=DEFAULT_TIMEOUT,
-                headers={"User-Agent": USER_AGENT},
-            ) as client:
-                resp = await client.get(url)
+            async with _get_client().stream("GET", url) as resp:
                 resp.raise_for_status()
+                raw, capped = await self._read_body(resp, max_chars * FETCH_BYTES_PER_CHAR)
 
             content_type = resp.headers.get("content-type", "")
+            head = raw[:SNIFF_BYTES].lstrip().lower()
             extractor = "raw"
 
-            # JSON response
-            if "application/json" in content_type:
-                text = json.dumps(resp.json(), indent=2, ensure_ascii=False)
+            # JSON response (a capped body cannot be parsed, return it raw).
+            # Stdlib json on purpose: orjson turns integers wider than 64
+            # bits into floats and rejects NaN, corrupting passed-through data.
+            if "application/json" in content_type and not capped:
+                text = json.dumps(json.loads(raw), indent=2, ensure_ascii=False)
                 extractor = "json"
 
             # HTML response
-            elif "text/html" in content_type or resp.text.lstrip().lower().startswith("<!doctype"):
-                doc = Document(resp.text)
-                body = doc.summary()
-
-                if extractMode == "markdown":
-                    body = self._html_to_markdown(body)
+            elif "text/html" in content_type or head.startswith(HTML_SIGNATURES):
+                page = self._decode(raw, resp.charset_encoding)
+                if extractMode == "text" and HTMLTree is not None:
+                    title, body = self._extract_plain_text(page)
+                    extractor = "resiliparse"
+                elif Document is None:
+                    return _dumps({"error": "readability-lxml not installed", "url": url})
                 else:
-                    body = strip_html(body)
+                    doc = Document(page)
+                    body = doc.summary()
+
+                    if extractMode == "markdown":
+                        body = self._html_to_markdown(body)
+                    else:
+                        body = strip_html(body)
+
+                    title = doc.title()
+                    extractor = "readability"
 
-                title = doc.title()
                 text = f"# {title}\n\n{body}" if title else body
-                extractor = "readability"
 
             # Plain text / others
             else:
-                text = resp.text
+                text = self._decode(raw, resp.charset_encoding)
 
-            truncated = len(text) > max_chars
+            truncated = capped or len(text) > max_chars
             if truncated:
                 text = text[:max_chars]
 
-            return json.dumps(
+            return _dumps(
                 {
                     "url": url,
                     "finalUrl": str(resp.url),
@@ -256,34 +376,44 @@ class WebFetchTool(Tool):
                     "truncated": truncated,
                     "text": text,
                 },
-                ensure_ascii=False,
             )
 
         except Exception as exc:
-            return json.dumps({"error": str(exc), "url": url})
+            return _dumps({"error": str(exc), "url": url})
 
     # -------------------------------------------------------------------------
 
+    @staticmethod
+    async def _read_body(resp: httpx.Response, limit: int) -> tuple[bytes, bool]:
+        """Read at most ~limit bytes of a streamed body; True if cut short."""
+        buf = bytearray()
+        async for chunk in resp.aiter_bytes(FETCH_CHUNK_SIZE):
+            buf += chunk
+            if len(buf) > limit:
+                return bytes(buf), True
+        return bytes(buf), False
+
+    @staticmethod
+    def _decode(raw: bytes, charset: str | None) -> str:
+        try:
+            return raw.decode(charset or "utf-8", errors="replace")
+        except LookupError:  # unknown charset in Content-Type
+            return raw.decode("utf-8", errors="replace")
+
+    def _extract_plain_text(self, html_text: str) -> tuple[str, str]:
+        """Main-content text extraction with resiliparse (no markdown)."""
+        tree = HTMLTree.parse(html_text)
+        body = extract_plain_text(tree, main_content=True, links=False, list_bullets=True)
+        return (tree.title or "").strip(), body
+
     def _html_to_markdown(self, html_text: str) -> str:
         """Best-effort HTML → markdown conversion."""
-        text = re.sub(
-            r'<a\s+[^>]*href=["\']([^"\']+)["\'][^>]*>(.*?)</a>',
-            lambda m: f"[{strip_html(m[2])}]({m[1]})",
-            html_text,
-            flags=re.I | re.S,
-        )
-        text = re.sub(
-            r"<h([1-6])[^>]*>(.*?)</h\1>",
-            lambda m: f"\n{'#' * int(m[1])} {strip_html(m[2])}\n",
-            text,
-            flags=re.I | re.S,
-        )
-        text = re.sub(
-            r"<li[^>]*>(.*?)</li>",
-            lambda m: f"\n- {strip_html(m[1])}",
-            text,
-            flags=re.I | re.S,
-        )
-        text = re.sub(r"</(p|div|section|article)>", "\n\n", text, flags=re.I)
-        text = re.sub(r"<(br|hr)\s*/?>", "\n", text, flags=re.I)
+        # Kept as sequential regex passes on purpose: an lxml tree walk and a
+        # single alternation regex were both measured slower on article-sized
+        # input, since each pass here is a C-level scan with a literal prefix.
+        text = _A_TAG_RE.sub(lambda m: f"[{strip_html(m[2])}]({m[1]})", html_text)
+        text = _H_TAG_RE.sub(lambda m: f"\n{'#' * int(m[1])} {strip_html(m[2])}\n", text)
+        text = _LI_TAG_RE.sub(lambda m: f"\n- {strip_html(m[1])}", text)
+        text = _BLOCK_END_RE.sub("\n\n", text)
+        text = _BR_HR_RE.sub("\n", text)
         return normalize_text(strip_html(text))
@@ -10,10 +10,12 @@ Design principles (ClawAI style):
 
 from __future__ import annotations
 
+import os
+import time
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Final
+from typing import ClassVar, Final
 
 
 # ===========================
@@ -33,16 +35,23 @@ class RuntimePaths:
 
     root: Path
 
+    # Roots whose directory tree was already created in this process
+    _ensured: ClassVar[set[Path]] = set()
+
     @classmethod
     def default(cls) -> "RuntimePaths":
         return cls(root=Path.home() / ".clawai")
 
     def ensure(self) -> "RuntimePaths":
-        self.root.mkdir(parents=True, exist_ok=True)
-        self.sessions.mkdir(parents=True, exist_ok=True)
-        self.workspace.mkdir(parents=True, exist_ok=True)
-        self.memory.mkdir(parents=True, exist_ok=True)
-        self.skills.mkdir(parents=True, exist_ok=True)
+        if self.root in self._ensured:
+            return self
+
+        # A stat is cheaper than mkdir's EEXIST + stat on existing dirs
+        for path in (self.root, self.sessions, self.workspace, self.memory, self.skills):
+            if not path.is_dir():
+                path.mkdir(parents=True, exist_ok=True)
+
+        self._ensured.add(self.root)
         return self
 
     @property
@@ -70,19 +79,34 @@ RUNTIME_PATHS: Final[RuntimePaths] = RuntimePaths.default().ensure()
 # Clock Utilities
 # ===========================
 
+# (unix time of the next local midnight, today's date string)
+_today_cache: tuple[float, str] = (0.0, "")
+
+
 def today() -> str:
     """Return today's date (YYYY-MM-DD)."""
-    return datetime.now().strftime("%Y-%m-%d")
+    global _today_cache
+
+    until, value = _today_cache
+    if time.time() < until:
+        return value
+
+    # Keyed on local midnight, not time() // 86400, which is the UTC day
+    now = datetime.now()
+    midnight = (now + timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    value = now.strftime("%Y-%m-%d")
+    _today_cache = (midnight.timestamp(), value)
+    return value
 
 
 def now_iso() -> str:
-    """Return current timestamp in ISO-8601 format."""
-    return datetime.now().isoformat()
+    """Return current timestamp in ISO-8601 format (millisecond precision)."""
+    return datetime.now().isoformat(timespec="milliseconds")
 
 
 def now_ms() -> int:
     """Return current unix time in milliseconds."""
-    return int(datetime.now().timestamp() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 # ===========================
@@ -101,6 +125,8 @@ def truncate(s: str, max_len: int = 120, suffix: str = "...") -> str:
 
 def safe_filename(name: str) -> str:
     """Convert arbitrary string to filesystem-safe filename."""
+    # Faster than str.translate: replace() is a memchr scan and returns the
+    # string itself when the char is absent, the common case for keys.
     for ch in _UNSAFE_CHARS:
         name = name.replace(ch, "_")
     return name.strip()
@@ -137,3 +163,28 @@ def ensure_dir(path: Path) -> Path:
     """Ensure directory exists."""
     path.mkdir(parents=True, exist_ok=True)
     return path
+
+
+# ===========================
+# Durable IO Helpers
+# ===========================
+
+def write_all(fd: int, buf: bytes) -> None:
+    """Write the whole buffer to a raw fd (os.write may be partial)."""
+    view = memoryview(buf)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def fsync_dir(path: Path) -> None:
+    """Persist a rename/link by fsyncing the containing directory."""
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass  # e.g. Windows rejects fsync on directories
+    finally:
+        os.close(fd)
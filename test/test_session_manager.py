@@ -0,0 +1,242 @@
+import pytest
+
+from clawai.session import manager as session_manager
+from clawai.session.manager import SessionManager
+from clawai.utils.helpers import RuntimePaths
+
+
+@pytest.fixture
+def paths(tmp_path, monkeypatch):
+    paths = RuntimePaths(root=tmp_path).ensure()
+    monkeypatch.setattr(session_manager, "RUNTIME_PATHS", paths)
+    return paths
+
+
+def _manager(**kwargs) -> SessionManager:
+    return SessionManager(use_compression=False, **kwargs)
+
+
+def _contents(session) -> list[str]:
+    return [m["content"] for m in session.messages]
+
+
+def _seed(key: str = "cli:k") -> None:
+    mgr = _manager()
+    session = mgr.get(key)
+    session.append("user", "base")
+    assert mgr.save(session)
+
+
+# ---------- stale precondition ----------
+
+def test_append_rejects_stale_session(paths):
+    _seed()
+    a, b = _manager(), _manager()
+    sa, sb = a.get("cli:k"), b.get("cli:k")
+
+    sb.append("user", "from-B")
+    assert b.append(sb)
+
+    sa.append("user", "from-A")
+    assert not a.append(sa)
+    assert not a.save(sa)
+
+    assert _contents(_manager().get("cli:k")) == ["base", "from-B"]
+
+
+def test_save_rejects_stale_session(paths):
+    _seed()
+    sa = _manager().get("cli:k")
+    b = _manager()
+    sb = b.get("cli:k")
+
+    sb.metadata["owner"] = "B"
+    assert b.save(sb)
+
+    sa.append("user", "from-A")
+    assert not _manager().save(sa)
+    reloaded = _manager().get("cli:k")
+    assert reloaded.metadata == {"owner": "B"}
+    assert _contents(reloaded) == ["base"]
+
+
+def test_append_after_own_save_still_allowed(paths):
+    mgr = _manager()
+    session = mgr.get("cli:k")
+    session.append("user", "one")
+    assert mgr.save(session)
+    session.append("user", "two")
+    assert mgr.append(session)
+    session.append("user", "three")
+    assert mgr.append(session)
+    assert _contents(_manager().get("cli:k")) == ["one", "two", "three"]
+
+
+# ---------- append / compaction ----------
+
+def test_reload_keeps_updated_at_of_last_append(paths):
+    mgr = _manager()
+    session = mgr.get("cli:k")
+    session.append("user", "one")
+    assert mgr.save(session)
+    session.append("user", "two")
+    assert mgr.append(session)
+
+    assert _manager().get("cli:k").updated_at == session.updated_at
+
+
+def test_append_persists_metadata_changes(paths):
+    mgr = _manager()
+    session = mgr.get("cli:k")
+    session.append("user", "one")
+    assert mgr.save(session)
+
+    session.metadata["topic"] = "x"
+    session.append("user", "two")
+    assert mgr.append(session)
+
+    reloaded = _manager().get("cli:k")
+    assert reloaded.metadata == {"topic": "x"}
+    assert _contents(reloaded) == ["one", "two"]
+
+
+def test_append_compacts_periodically(paths, monkeypatch):
+    monkeypatch.setattr(session_manager, "COMPACT_EVERY_APPENDS", 3)
+    mgr = _manager()
+    session = mgr.get("cli:k")
+    session.append("user", "0")
+    assert mgr.save(session)
+
+    for i in range(1, 5):
+        session.append("user", str(i))
+        assert mgr.append(session)
+
+    # Appends 1-3 went to the tail; the 4th compacted through save().
+    assert session._appends == 0
+    header = mgr._path("cli:k").read_bytes().split(b"\n", 1)[0]
+    assert session.updated_at.encode() in header
+    assert _contents(_manager().get("cli:k")) == ["0", "1", "2", "3", "4"]
+
+
+def test_compressed_appends_are_recompressed(paths):
+    zstd = pytest.importorskip("zstandard")
+    mgr = SessionManager(use_compression=True)
+    session = mgr.get("cli:z")
+    session.append("user", "hello")
+    assert mgr.save(session)
+
+    for i in range(100):
+        session.append("user", f"turn {i}: some repeated conversational text")
+        assert mgr.append(session)
+
+    path = mgr._path("cli:z")
+    single = len(zstd.ZstdCompressor(level=session_manager.ZSTD_LEVEL).compress(
+        session_manager._read_plain(path)
+    ))
+    assert path.stat().st_size <= (1 + session_manager.COMPACT_FRAME_RATIO) * single + 512
+    assert len(_manager().get("cli:z").messages) == 101
+
+
+def test_manager_options_are_keyword_only(paths):
+    with pytest.raises(TypeError):
+        SessionManager(paths.workspace)
+
+
+def test_list_skips_non_session_files(paths):
+    _seed()
+    (paths.sessions / "stray.jsonl").write_text("[1,2]\n")
+    (paths.sessions / "junk.jsonl").write_text("not json\n")
+    (paths.sessions / session_manager.INDEX_FILENAME).unlink()  # force a scan
+
+    assert [e["key"] for e in _manager().list()] == ["cli:k"]
+
+
+# ---------- lazy messages / corrupt lines ----------
+
+_CORRUPT = (
+    b'{"_type":"metadata","key":"cli:c","metadata":{}}\n'
+    b'{"role":"user","content":"0"}\n'
+    b'\r\n'
+    b'{broken\n'
+    b'\n'
+    b'{"role":"user","content":"1"}\n'
+    b'{"role":"user","content":"2"}\n'
+    b'{"role":"user","cont'
+)
+
+
+def _load_corrupt(paths):
+    (paths.sessions / "cli_c.jsonl").write_bytes(_CORRUPT)
+    mgr = _manager()
+    return mgr, mgr.get("cli:c")
+
+
+def test_load_drops_corrupt_lines_up_front(paths):
+    _, session = _load_corrupt(paths)
+    msgs = session.messages
+
+    assert len(msgs) == 3
+    assert session.history(2) == [
+        {"role": "user", "content": "1"},
+        {"role": "user", "content": "2"},
+    ]
+    assert len(msgs) == 3
+    assert msgs[1]["content"] == "1"
+    assert [m["content"] for m in msgs[-2:]] == ["1", "2"]
+
+
+def test_next_append_repairs_corrupt_file(paths):
+    mgr, session = _load_corrupt(paths)
+    session.append("user", "3")
+    assert mgr.append(session)
+
+    data = (paths.sessions / "cli_c.jsonl").read_bytes()
+    assert b"{broken" not in data and b'"cont\n' not in data
+    assert _contents(_manager().get("cli:c")) == ["0", "1", "2", "3"]
+
+
+def test_lazy_messages_sequence_protocol(paths):
+    mgr = _manager()
+    session = mgr.get("cli:k")
+    for i in range(4):
+        session.append("user", str(i))
+    assert mgr.save(session)
+
+    msgs = _manager().get("cli:k").messages
+    assert isinstance(msgs, session_manager.LazyMessages)
+    assert msgs.raw(0) is not None
+
+    msgs.append({"role": "user", "content": "4"})
+    assert len(msgs) == 5 and msgs[-1]["content"] == "4"
+    assert [m["content"] for m in msgs] == ["0", "1", "2", "3", "4"]
+    assert msgs == list(msgs)
+
+    msgs[1] = {"role": "user", "content": "one"}
+    assert msgs.raw(1) is None and msgs[1]["content"] == "one"
+
+    del msgs[0]
+    assert [m["content"] for m in msgs] == ["one", "2", "3", "4"]
+    msgs.insert(0, {"role": "user", "content": "zero"})
+    assert msgs[0]["content"] == "zero" and len(msgs) == 5
+
+    with pytest.raises(IndexError):
+        msgs[5]
+    msgs.clear()
+    assert len(msgs) == 0 and list(msgs) == []
+
+
+def test_save_reuses_untouched_lines(paths):
+    mgr = _manager()
+    session = mgr.get("cli:k")
+    for i in range(3):
+        session.append("user", str(i))
+    assert mgr.save(session)
+    before = mgr._path("cli:k").read_bytes()
+
+    reloaded_mgr = _manager()
+    reloaded = reloaded_mgr.get("cli:k")
+    reloaded.metadata["x"] = 1
+    assert reloaded_mgr.save(reloaded)
+
+    after = mgr._path("cli:k").read_bytes()
+    assert after.split(b"\n", 1)[1] == before.split(b"\n", 1)[1]